@@ -1,14 +1,20 @@
 """Alternative entry point for the FastAPI application."""
 
+from importlib.util import find_spec
+
 from app.main import app
 
 if __name__ == "__main__":
     import uvicorn
     from app.config import config
     
+    # Use the uvloop event loop and httptools parser when they are installed
     uvicorn.run(
         "app.main:app",
         host=config.get("app.host", "0.0.0.0"),
         port=config.get("app.port", 8000),
-        reload=config.get("app.debug", True)
+        reload=config.get("app.debug", True),
+        loop="uvloop" if find_spec("uvloop") else "auto",
+        http="httptools" if find_spec("httptools") else "auto",
+        workers=config.get("app.workers", 1)
     )
\ No newline at end of file
@@ -5,6 +5,9 @@ import yaml
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# Prefer the libyaml C parser when PyYAML was built against it
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class Config:
     """Configuration class for loading and managing application settings."""
@@ -12,14 +15,24 @@ class Config:
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
         self._config = self._load_config()
+        self._flat = dict(self._flatten(self._config))
+    
+    @classmethod
+    def _flatten(cls, d: Dict[str, Any], prefix: str = ''):
+        """Yield (dotted_key, value) pairs for every subtree and leaf in d."""
+        for k, v in d.items():
+            key = f"{prefix}{k}"
+            yield key, v
+            if isinstance(v, dict):
+                yield from cls._flatten(v, f"{key}.")
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file and environment variables."""
         # Load from YAML file
         config_file = Path(self.config_path)
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(config_file, 'rb') as f:
+                config = yaml.load(f, Loader=Loader)
         else:
             config = {}
         
@@ -47,14 +60,7 @@ class Config:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot notation key."""
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        return self._flat.get(key, default)
     
     @property
     def model_name(self) -> str:
@@ -64,6 +70,14 @@ class Config:
     def model_max_length(self) -> int:
         return self.get('model.max_length')
     
+    @property
+    def model_compile(self) -> bool:
+        return self.get('model.compile', False)
+    
+    @property
+    def model_quantize(self) -> bool:
+        return self.get('model.quantize', False)
+    
     @property
     def factcheck_api_key(self) -> Optional[str]:
         return self.get('factcheck.api_key')
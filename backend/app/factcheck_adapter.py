@@ -1,12 +1,23 @@
 """Fact-check adapter for integrating with external fact-checking APIs."""
 
-import requests
+import asyncio
+import httpx
 from typing import List, Dict, Optional
 import logging
+import re
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# Patterns used for claim extraction, compiled once at import
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+# Numbers, reporting verbs, or quantities, matched in a single pass
+_CLAIM_HINT = re.compile(
+    r'\d|\b(?:said|reported|according|study|research|data'
+    r'|percent|million|billion|thousand)\b',
+    re.IGNORECASE
+)
+
 
 class FactCheckAdapter:
     """Adapter for fact-checking services."""
@@ -15,14 +26,34 @@ class FactCheckAdapter:
         self.api_key = api_key
         self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
         self.enabled = api_key is not None
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use so connections are pooled."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10)
+        return self._client
+    
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
-    def check_claims(self, text: str, max_claims: int = 5) -> List[Dict[str, any]]:
+    async def check_claims(
+        self,
+        text: str,
+        max_claims: int = 5,
+        sentences: Optional[List[str]] = None
+    ) -> List[Dict[str, any]]:
         """
         Check claims in the text against fact-checking databases.
         
         Args:
             text: Text to fact-check
             max_claims: Maximum number of claims to return
+            sentences: Precomputed sentence split of text, if available
             
         Returns:
             List of fact-check results
@@ -32,11 +63,15 @@ class FactCheckAdapter:
         
         try:
             # Extract key claims from text (simplified approach)
-            claims = self._extract_claims(text)
+            claims = self._extract_claims(text, sentences)
+            
+            # Query all claims concurrently
+            results = await asyncio.gather(
+                *(self._query_google_factcheck(claim) for claim in claims[:max_claims])
+            )
             
             fact_check_results = []
-            for claim in claims[:max_claims]:
-                result = self._query_google_factcheck(claim)
+            for result in results:
                 if result:
                     fact_check_results.extend(result)
             
@@ -46,32 +81,28 @@ class FactCheckAdapter:
             logger.error(f"Fact-check query failed: {e}")
             return []
     
-    def _extract_claims(self, text: str) -> List[str]:
+    def _extract_claims(self, text: str, sentences: Optional[List[str]] = None) -> List[str]:
         """
         Extract potential factual claims from text.
         
         This is a simplified implementation. In production, you might use
         more sophisticated NLP techniques to identify factual statements.
         """
-        import re
-        
-        # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        # Split into sentences unless the caller already did
+        if sentences is None:
+            sentences = _SENT_SPLIT.split(text)
         
         # Filter for sentences that might contain factual claims
         claims = []
         for sentence in sentences:
             sentence = sentence.strip()
             # Look for sentences with numbers, dates, names, or factual indicators
-            if (len(sentence) > 20 and 
-                (re.search(r'\d+', sentence) or  # Contains numbers
-                 re.search(r'\b(said|reported|according|study|research|data)\b', sentence, re.IGNORECASE) or
-                 re.search(r'\b(percent|million|billion|thousand)\b', sentence, re.IGNORECASE))):
+            if len(sentence) > 20 and _CLAIM_HINT.search(sentence):
                 claims.append(sentence)
         
         return claims[:5]  # Limit to 5 claims
     
-    def _query_google_factcheck(self, query: str) -> Optional[List[Dict[str, any]]]:
+    async def _query_google_factcheck(self, query: str) -> Optional[List[Dict[str, any]]]:
         """Query Google Fact Check Tools API."""
         try:
             params = {
@@ -80,7 +111,7 @@ class FactCheckAdapter:
                 'languageCode': 'en'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = await self.client.get(self.base_url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -2,7 +2,8 @@
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from cachetools import TTLCache
 import logging
 import sys
 from contextlib import asynccontextmanager
@@ -13,7 +14,7 @@ from .models import (
     ErrorResponse, HealthResponse
 )
 from .config import config
-from .nlp_engine import FakeNewsDetector
+from .nlp_engine import FakeNewsDetector, split_sentences
 from .factcheck_adapter import FactCheckAdapter
 from .scoring import CredibilityScorer
 from .scraper import ArticleScraper
@@ -28,12 +29,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Serialize responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Global instances
 nlp_detector = None
 fact_checker = None
 scorer = None
 scraper = None
 
+# Rendered /predict-url responses keyed by URL
+url_cache = TTLCache(
+    maxsize=config.get("cache.url_maxsize", 1024),
+    ttl=config.get("cache.url_ttl", 3600)
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -48,8 +62,11 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing NLP detector...")
         nlp_detector = FakeNewsDetector(
             model_name=config.model_name,
-            max_length=config.model_max_length
+            max_length=config.model_max_length,
+            compile_model=config.model_compile,
+            quantize=config.model_quantize
         )
+        nlp_detector.warmup()
         
         logger.info("Initializing fact-checker...")
         fact_checker = FactCheckAdapter(api_key=config.factcheck_api_key)
@@ -73,6 +90,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Fake News Detector API...")
+    if fact_checker:
+        await fact_checker.aclose()
+    if scraper:
+        await scraper.aclose()
 
 
 # Create FastAPI app
@@ -80,7 +101,8 @@ app = FastAPI(
     title="AI-Powered Fake News Detector",
     description="Detect fake news using AI models, fact-checking, and source reputation analysis",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # Add CORS middleware
@@ -97,7 +119,7 @@ app.add_middleware(
 async def global_exception_handler(request, exc):
     """Global exception handler."""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return DefaultResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"error": "Internal server error", "detail": str(exc)}
     )
@@ -141,11 +163,14 @@ async def predict_text(request: TextPredictionRequest):
         logger.info(f"Analyzing text of length {len(request.text)}")
         model_prediction = nlp_detector.predict(request.text)
         
+        # Split once and share between sentence analysis and claim extraction
+        sentences = split_sentences(request.text)
+        
         # Get sentence-level analysis
-        sentence_analysis = nlp_detector.analyze_sentences(request.text)
+        sentence_analysis = nlp_detector.analyze_sentences(request.text, sentences=sentences)
         
         # Get fact-check results
-        fact_check_results = fact_checker.check_claims(request.text)
+        fact_check_results = await fact_checker.check_claims(request.text, sentences=sentences)
         
         # Calculate credibility score
         scoring_result = scorer.calculate_credibility_score(
@@ -154,25 +179,14 @@ async def predict_text(request: TextPredictionRequest):
             domain=None  # No domain for direct text input
         )
         
-        # Prepare highlights (top 5 most suspicious sentences)
-        highlights = [
-            {
-                "sentence": item["sentence"],
-                "suspicion_score": item["suspicion_score"],
-                "position": item["position"],
-                "label": item["label"]
-            }
-            for item in sentence_analysis[:5]
-        ]
-        
-        return PredictionResponse(
+        response = PredictionResponse(
             label=model_prediction["label"],
             model_confidence=model_prediction["confidence"],
             credibility_score=scoring_result["credibility_score"],
             source=None,
             source_reputation=None,
             fact_check=fact_check_results,
-            highlights=highlights,
+            highlights=sentence_analysis[:5],  # Top 5 most suspicious sentences
             explainability={
                 "method": "sentence_scoring",
                 "details": f"Analyzed {len(sentence_analysis)} sentences using {nlp_detector.model_name}"
@@ -185,6 +199,9 @@ async def predict_text(request: TextPredictionRequest):
             }
         )
         
+        # Already validated above; return it directly so FastAPI does not re-validate
+        return DefaultResponse(content=response.model_dump())
+        
     except Exception as e:
         logger.error(f"Prediction failed: {e}")
         raise HTTPException(
@@ -194,12 +211,18 @@ async def predict_text(request: TextPredictionRequest):
 
 
 @app.post("/predict-url", response_model=PredictionResponse)
-async def predict_url(request: URLPredictionRequest):
+async def predict_url(request: URLPredictionRequest, nocache: bool = False):
     """Predict credibility of article from URL."""
+    cache_key = str(request.url)
+    if not nocache:
+        cached = url_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
     try:
         # Scrape article content
         logger.info(f"Scraping article from URL: {request.url}")
-        scrape_result = scraper.extract_article(str(request.url))
+        scrape_result = await scraper.extract_article_async(str(request.url))
         
         if scrape_result["error"]:
             raise HTTPException(
@@ -216,11 +239,14 @@ async def predict_url(request: URLPredictionRequest):
         # Get model prediction
         model_prediction = nlp_detector.predict(scrape_result["text"])
         
+        # Split once and share between sentence analysis and claim extraction
+        sentences = split_sentences(scrape_result["text"])
+        
         # Get sentence-level analysis
-        sentence_analysis = nlp_detector.analyze_sentences(scrape_result["text"])
+        sentence_analysis = nlp_detector.analyze_sentences(scrape_result["text"], sentences=sentences)
         
         # Get fact-check results
-        fact_check_results = fact_checker.check_claims(scrape_result["text"])
+        fact_check_results = await fact_checker.check_claims(scrape_result["text"], sentences=sentences)
         
         # Calculate credibility score
         scoring_result = scorer.calculate_credibility_score(
@@ -229,25 +255,14 @@ async def predict_url(request: URLPredictionRequest):
             domain=scrape_result["domain"]
         )
         
-        # Prepare highlights (top 5 most suspicious sentences)
-        highlights = [
-            {
-                "sentence": item["sentence"],
-                "suspicion_score": item["suspicion_score"],
-                "position": item["position"],
-                "label": item["label"]
-            }
-            for item in sentence_analysis[:5]
-        ]
-        
-        return PredictionResponse(
+        response = PredictionResponse(
             label=model_prediction["label"],
             model_confidence=model_prediction["confidence"],
             credibility_score=scoring_result["credibility_score"],
             source=scrape_result["domain"],
             source_reputation=scoring_result["source_reputation"],
             fact_check=fact_check_results,
-            highlights=highlights,
+            highlights=sentence_analysis[:5],  # Top 5 most suspicious sentences
             explainability={
                 "method": "sentence_scoring",
                 "details": f"Analyzed {len(sentence_analysis)} sentences using {nlp_detector.model_name}"
@@ -262,6 +277,11 @@ async def predict_url(request: URLPredictionRequest):
             }
         )
         
+        # Already validated above; return it directly so FastAPI does not re-validate
+        http_response = DefaultResponse(content=response.model_dump())
+        url_cache[cache_key] = http_response.body
+        return http_response
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -1,20 +1,30 @@
 """Pydantic models for API request/response schemas."""
 
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 from typing import List, Optional, Dict, Any
 
 
-class TextPredictionRequest(BaseModel):
+class APIModel(BaseModel):
+    """Base model with the validation settings shared by all API schemas."""
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        protected_namespaces=()  # Allow field names like model_confidence
+    )
+
+
+class TextPredictionRequest(APIModel):
     """Request model for text-based prediction."""
     text: str = Field(..., min_length=10, max_length=50000, description="Article text to analyze")
 
 
-class URLPredictionRequest(BaseModel):
+class URLPredictionRequest(APIModel):
     """Request model for URL-based prediction."""
     url: HttpUrl = Field(..., description="URL of article to analyze")
 
 
-class FactCheckResult(BaseModel):
+class FactCheckResult(APIModel):
     """Model for fact-check results."""
     claim: str = Field(..., description="The claim being fact-checked")
     url: str = Field(..., description="URL to the fact-check article")
@@ -24,49 +34,51 @@ class FactCheckResult(BaseModel):
     mock: Optional[bool] = Field(default=False, description="Whether this is a mock result")
 
 
-class SentenceHighlight(BaseModel):
+class SentenceHighlight(APIModel):
     """Model for sentence-level highlights."""
+    model_config = ConfigDict(from_attributes=True)  # Built from SentenceAnalysis records
+    
     sentence: str = Field(..., description="The sentence text")
     suspicion_score: float = Field(..., ge=0.0, le=1.0, description="Suspicion score (0-1)")
     position: int = Field(..., ge=0, description="Position in original text")
     label: str = Field(..., description="Predicted label for this sentence")
 
 
-class CredibilityBreakdown(BaseModel):
+class CredibilityBreakdown(APIModel):
     """Model for credibility score breakdown."""
     model_score: float = Field(..., description="Score from AI model (0-100)")
     factcheck_score: float = Field(..., description="Score from fact-checking (0-100)")
     source_score: float = Field(..., description="Score from source reputation (0-100)")
 
 
-class ExplainabilityInfo(BaseModel):
+class ExplainabilityInfo(APIModel):
     """Model for explainability information."""
     method: str = Field(..., description="Method used for explainability")
     details: str = Field(..., description="Details about the analysis")
 
 
-class PredictionResponse(BaseModel):
+class PredictionResponse(APIModel):
     """Response model for predictions."""
     label: str = Field(..., description="Predicted label (Fake, Real, Biased, Satire)")
     model_confidence: float = Field(..., ge=0.0, le=1.0, description="Model confidence score")
     credibility_score: float = Field(..., ge=0.0, le=100.0, description="Overall credibility score (0-100)")
     source: Optional[str] = Field(default=None, description="Source domain")
     source_reputation: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="Source reputation score")
-    fact_check: List[FactCheckResult] = Field(default=[], description="Fact-check results")
-    highlights: List[SentenceHighlight] = Field(default=[], description="Sentence-level highlights")
+    fact_check: List[FactCheckResult] = Field(default_factory=list, description="Fact-check results")
+    highlights: List[SentenceHighlight] = Field(default_factory=list, description="Sentence-level highlights")
     explainability: ExplainabilityInfo = Field(..., description="Explainability information")
     breakdown: CredibilityBreakdown = Field(..., description="Score breakdown")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(APIModel):
     """Error response model."""
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(default=None, description="Detailed error information")
     code: Optional[str] = Field(default=None, description="Error code")
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(APIModel):
     """Health check response model."""
     status: str = Field(..., description="Service status")
     model_info: Dict[str, str] = Field(..., description="Model information")
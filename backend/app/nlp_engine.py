@@ -1,41 +1,132 @@
 """NLP engine for fake news detection using HuggingFace transformers."""
 
-from transformers import pipeline, AutoTokenizer
-from typing import Dict, List, Tuple, Optional
-import torch
+from typing import Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
 import logging
 import re
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Simple sentence boundary: whitespace following terminal punctuation
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Map various model label formats to standard ones
+_LABEL_MAP: Dict[str, str] = {
+    **dict.fromkeys(('fake', 'false', 'unreliable', 'fabricated'), 'Fake'),
+    **dict.fromkeys(('real', 'true', 'reliable', 'factual'), 'Real'),
+    **dict.fromkeys(('biased', 'opinion', 'misleading'), 'Biased'),
+    **dict.fromkeys(('satire', 'humor', 'comedy'), 'Satire'),
+}
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences using simple regex."""
+    # Simple sentence splitting - could be improved with spaCy or NLTK
+    return [s for s in (t.strip() for t in _SENT_SPLIT.split(text)) if s]
+
+
+@dataclass
+class SentenceAnalysis:
+    """Suspicion analysis of a single sentence."""
+    __slots__ = ('sentence', 'suspicion_score', 'position', 'label')
+    
+    sentence: str
+    suspicion_score: float
+    position: int
+    label: str
+
 
 class FakeNewsDetector:
     """NLP engine for detecting fake news using transformer models."""
     
-    def __init__(self, model_name: str, max_length: int = 512):
+    def __init__(
+        self,
+        model_name: str,
+        max_length: int = 512,
+        cache_size: int = 4096,
+        compile_model: bool = False,
+        quantize: bool = False
+    ):
         self.model_name = model_name
         self.max_length = max_length
-        self._pipeline = None
+        self.cache_size = cache_size
+        self.compile_model = compile_model
+        self.quantize = quantize
+        self._model = None
         self._tokenizer = None
+        self._labels: List[str] = []
+        self._std_labels: List[str] = []
+        self.device = None
+        # LRU of successful predictions keyed by text digest
+        self._pred_cache: "OrderedDict[bytes, Dict[str, any]]" = OrderedDict()
         self._load_model()
     
     def _load_model(self):
         """Load the model and tokenizer."""
+        # Imported here so that importing this module stays cheap
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+        
         try:
             logger.info(f"Loading model: {self.model_name}")
-            self._pipeline = pipeline(
-                "text-classification",
-                model=self.model_name,
-                tokenizer=self.model_name,
-                return_all_scores=True,
-                device=0 if torch.cuda.is_available() else -1
-            )
+            self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
             self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self._model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            self._model.to(self.device).eval()
+            id2label = self._model.config.id2label
+            self._labels = [id2label[i] for i in range(len(id2label))]
+            # Standardize once here rather than on every prediction
+            self._std_labels = [self._standardize_label(label) for label in self._labels]
+            if self.quantize:
+                self._optimize_model()
+            if self.compile_model:
+                self._compile()
             logger.info("Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
     
+    def _optimize_model(self):
+        """Use reduced-precision weights: FP16/BF16 on GPU, dynamic int8 on CPU."""
+        import torch
+        
+        try:
+            if self.device == 'cuda':
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                self._model.to(dtype)
+            else:
+                self._model = torch.ao.quantization.quantize_dynamic(
+                    self._model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+        except Exception as e:
+            logger.warning(f"Model optimization skipped, using full precision: {e}")
+    
+    def _compile(self):
+        """Wrap the model with torch.compile; compilation happens on the first call."""
+        import torch
+        
+        try:
+            self._model = torch.compile(
+                self._model, mode='reduce-overhead', fullgraph=False
+            )
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, running eagerly: {e}")
+    
+    def warmup(self):
+        """Run a dummy batch so one-time compile and kernel setup costs are paid up front."""
+        try:
+            self._forward(["warmup text"] * 4)
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+            original = getattr(self._model, '_orig_mod', None)
+            if original is not None:
+                logger.warning("Falling back to the uncompiled model")
+                self._model = original
+    
     def predict(self, text: str) -> Dict[str, any]:
         """
         Predict if text is fake news.
@@ -46,36 +137,23 @@ class FakeNewsDetector:
         Returns:
             Dict with prediction results
         """
-        if not self._pipeline:
+        if not self._model:
             raise RuntimeError("Model not loaded")
         
-        # Truncate text if too long
-        truncated_text = self._truncate_text(text)
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
+        result = self._predict_impl(text)
+        if 'error' not in result:
+            self._cache_put(key, result)
+        return result
+    
+    def _predict_impl(self, text: str) -> Dict[str, any]:
+        """Run the model on a single text without consulting the cache."""
         try:
-            # Get prediction
-            results = self._pipeline(truncated_text)
-            
-            # Process results - handle different model output formats
-            if isinstance(results[0], list):
-                scores = results[0]
-            else:
-                scores = results
-            
-            # Find the prediction with highest confidence
-            best_prediction = max(scores, key=lambda x: x['score'])
-            
-            # Map labels to standardized format
-            label = self._standardize_label(best_prediction['label'])
-            confidence = best_prediction['score']
-            
-            return {
-                'label': label,
-                'confidence': confidence,
-                'raw_scores': scores,
-                'text_length': len(text),
-                'truncated': len(text) > self.max_length
-            }
+            return self._classify([text])[0]
             
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
@@ -88,83 +166,131 @@ class FakeNewsDetector:
                 'error': str(e)
             }
     
-    def analyze_sentences(self, text: str) -> List[Dict[str, any]]:
+    def analyze_sentences(self, text: str, sentences: Optional[List[str]] = None) -> List[SentenceAnalysis]:
         """
         Analyze individual sentences for suspiciousness.
         
         Args:
             text: Article text to analyze
+            sentences: Precomputed result of split_sentences(text), if available
             
         Returns:
-            List of sentence analysis results
+            List of sentence analyses, most suspicious first
         """
-        sentences = self._split_sentences(text)
-        sentence_analyses = []
+        if sentences is None:
+            sentences = self._split_sentences(text)
         
-        for i, sentence in enumerate(sentences):
-            if len(sentence.strip()) < 10:  # Skip very short sentences
-                continue
-                
+        # Skip very short sentences but keep their original positions
+        candidates = [(i, s) for i, s in enumerate(sentences) if len(s.strip()) >= 10]
+        if not candidates:
+            return []
+        
+        # Serve repeated sentences from the cache and batch the rest through the model
+        keys = [self._cache_key(sentence) for _, sentence in candidates]
+        predictions = [self._cache_get(key) for key in keys]
+        misses = [j for j, prediction in enumerate(predictions) if prediction is None]
+        
+        if misses:
             try:
-                prediction = self.predict(sentence)
-                suspicion_score = 1.0 - prediction['confidence'] if prediction['label'] == 'Real' else prediction['confidence']
-                
-                sentence_analyses.append({
-                    'sentence': sentence,
-                    'suspicion_score': suspicion_score,
-                    'position': i,
-                    'label': prediction['label']
-                })
+                batch_predictions = self._classify([candidates[j][1] for j in misses])
+                for j, prediction in zip(misses, batch_predictions):
+                    predictions[j] = prediction
+                    self._cache_put(keys[j], prediction)
             except Exception as e:
-                logger.warning(f"Failed to analyze sentence {i}: {e}")
-                sentence_analyses.append({
-                    'sentence': sentence,
-                    'suspicion_score': 0.5,  # Neutral score for failed analysis
-                    'position': i,
-                    'label': 'Unknown'
-                })
+                logger.warning(f"Failed to analyze sentences: {e}")
+        
+        # Score and rank all sentences at once; failed analyses get a neutral 0.5
+        labels = [p['label'] if p else 'Unknown' for p in predictions]
+        confidences = np.fromiter(
+            (p['confidence'] if p else 0.5 for p in predictions),
+            dtype=np.float64,
+            count=len(predictions)
+        )
+        is_real = np.fromiter((label == 'Real' for label in labels), dtype=bool, count=len(labels))
+        scores = np.where(is_real, 1.0 - confidences, confidences)
         
-        # Sort by suspicion score (highest first)
-        sentence_analyses.sort(key=lambda x: x['suspicion_score'], reverse=True)
+        # Most suspicious first; stable so ties keep document order
+        order = np.argsort(-scores, kind='stable')
+        scores = scores.tolist()
         
-        return sentence_analyses
+        return [
+            SentenceAnalysis(candidates[j][1], scores[j], candidates[j][0], labels[j])
+            for j in order.tolist()
+        ]
     
-    def _truncate_text(self, text: str) -> str:
-        """Truncate text to fit model's maximum input length."""
-        if not self._tokenizer:
-            # Fallback: simple character-based truncation
-            return text[:self.max_length * 4]  # Rough estimate
+    def _forward(self, texts: List[str]):
+        """Run one batch through the model, returning class probabilities and argmax indices."""
+        import torch
         
-        # Tokenize and truncate
-        tokens = self._tokenizer.encode(text, truncation=True, max_length=self.max_length)
-        return self._tokenizer.decode(tokens, skip_special_tokens=True)
+        inputs = self._tokenizer(
+            texts,
+            return_tensors='pt',
+            truncation=True,
+            padding=True,
+            max_length=self.max_length
+        ).to(self.device)
+        with torch.inference_mode():
+            logits = self._model(**inputs).logits
+        probs = logits.float().softmax(-1)
+        return probs.cpu(), probs.argmax(-1).cpu()
+    
+    def _classify(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, any]]:
+        """Predict each text, running the model in batches of batch_size."""
+        predictions = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            probs, best = self._forward(batch)
+            for text, row, index in zip(batch, probs.tolist(), best.tolist()):
+                predictions.append(self._build_prediction(text, row, index))
+        return predictions
+    
+    def _build_prediction(self, text: str, probs: List[float], best: int) -> Dict[str, any]:
+        """Build the prediction dict for text from its class probabilities."""
+        return {
+            'label': self._std_labels[best],
+            'confidence': probs[best],
+            'raw_scores': [
+                {'label': label, 'score': score}
+                for label, score in zip(self._labels, probs)
+            ],
+            'text_length': len(text),
+            'truncated': len(text) > self.max_length
+        }
+    
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return blake2b(text.encode(), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, any]]:
+        """Return a copy of the cached prediction for key, if any."""
+        result = self._pred_cache.get(key)
+        if result is None:
+            return None
+        self._pred_cache.move_to_end(key)
+        return dict(result)
+    
+    def _cache_put(self, key: bytes, result: Dict[str, any]):
+        """Store a prediction, evicting the least recently used entry when full."""
+        if self.cache_size <= 0:
+            return
+        self._pred_cache[key] = dict(result)
+        self._pred_cache.move_to_end(key)
+        if len(self._pred_cache) > self.cache_size:
+            self._pred_cache.popitem(last=False)
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences using simple regex."""
-        # Simple sentence splitting - could be improved with spaCy or NLTK
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return split_sentences(text)
     
     def _standardize_label(self, label: str) -> str:
         """Standardize model labels to common format."""
         label = label.lower()
-        
-        # Map various label formats to standard ones
-        if label in ['fake', 'false', 'unreliable', 'fabricated']:
-            return 'Fake'
-        elif label in ['real', 'true', 'reliable', 'factual']:
-            return 'Real'
-        elif label in ['biased', 'opinion', 'misleading']:
-            return 'Biased'
-        elif label in ['satire', 'humor', 'comedy']:
-            return 'Satire'
-        else:
-            return label.capitalize()
+        return _LABEL_MAP.get(label) or label.capitalize()
     
     def get_model_info(self) -> Dict[str, str]:
         """Get information about the loaded model."""
         return {
             'model_name': self.model_name,
             'max_length': str(self.max_length),
-            'device': 'cuda' if torch.cuda.is_available() else 'cpu'
+            'device': self.device or 'cpu'
         }
\ No newline at end of file
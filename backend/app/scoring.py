@@ -1,27 +1,60 @@
 """Scoring module for calculating credibility scores."""
 
 import json
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Fact-check verdicts mapped to credibility scores (0-1); others score 0.5
+_VERDICT_SCORES = {
+    **dict.fromkeys(('true', 'correct', 'accurate', 'verified'), 1.0),
+    **dict.fromkeys(('false', 'incorrect', 'fabricated', 'fake'), 0.0),
+    **dict.fromkeys(('misleading', 'partly false', 'mixture'), 0.3),
+    **dict.fromkeys(('unproven', 'unsubstantiated', 'research in progress'), 0.4),
+}
+
+
+def _normalize_domain(domain: str) -> str:
+    """Lowercase a domain and strip a leading 'www.'."""
+    domain = domain.lower()
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
+@lru_cache(maxsize=8)
+def _read_domain_reputation(path: str, mtime: float) -> Dict[str, float]:
+    """Parse a domain reputation file; memoized per (path, mtime)."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
 
 class CredibilityScorer:
     """Calculator for credibility scores based on multiple factors."""
     
     def __init__(self, weights: Dict[str, float], domain_reputation_file: str):
         self.weights = weights
+        self._weights = self._resolve_weights()
         self.domain_reputation = self._load_domain_reputation(domain_reputation_file)
+        # Per-domain scores; domain_reputation is only loaded here, so this never goes stale
+        self._source_score_cache = lru_cache(maxsize=4096)(self._lookup_source_score)
     
     def _load_domain_reputation(self, file_path: str) -> Dict[str, float]:
         """Load domain reputation scores from JSON file."""
         try:
             reputation_file = Path(file_path)
             if reputation_file.exists():
-                with open(reputation_file, 'r') as f:
-                    return json.load(f)
+                mtime = reputation_file.stat().st_mtime
+                # Copy so callers can't mutate the shared cached dict
+                return dict(_read_domain_reputation(str(reputation_file.resolve()), mtime))
             else:
                 logger.warning(f"Domain reputation file not found: {file_path}")
                 return {}
@@ -56,10 +89,11 @@ class CredibilityScorer:
         source_score = self._calculate_source_score(domain)
         
         # Weighted combination
+        w_model, w_factcheck, w_source = self._weights
         credibility_score = (
-            model_score * self.weights.get('model_confidence', 0.5) +
-            factcheck_score * self.weights.get('fact_check_evidence', 0.3) +
-            source_score * self.weights.get('source_reputation', 0.2)
+            model_score * w_model +
+            factcheck_score * w_factcheck +
+            source_score * w_source
         ) * 100  # Scale to 0-100
         
         return {
@@ -73,6 +107,14 @@ class CredibilityScorer:
             'source_reputation': source_score if domain else None
         }
     
+    def _resolve_weights(self) -> Tuple[float, float, float]:
+        """Resolve (model, fact-check, source) weights, applying defaults."""
+        return (
+            self.weights.get('model_confidence', 0.5),
+            self.weights.get('fact_check_evidence', 0.3),
+            self.weights.get('source_reputation', 0.2)
+        )
+    
     def _calculate_model_score(self, prediction: Dict[str, any]) -> float:
         """Calculate score from model prediction (0-1 scale)."""
         label = prediction.get('label', 'Unknown')
@@ -92,44 +134,31 @@ class CredibilityScorer:
     
     def _calculate_factcheck_score(self, fact_check_results: List[Dict[str, any]]) -> float:
         """Calculate score from fact-check results (0-1 scale)."""
-        if not fact_check_results:
-            return 0.5  # Neutral score when no fact-checks available
-        
-        # Check if any results are mocked (API unavailable)
-        if any(result.get('mock', False) for result in fact_check_results):
-            return 0.5  # Neutral score for mock results
-        
-        verdict_scores = []
+        total = 0.0
+        count = 0
         for result in fact_check_results:
-            verdict = result.get('verdict', '').lower()
+            # Mocked results mean the API is unavailable
+            if result.get('mock', False):
+                return 0.5  # Neutral score for mock results
             
             # Map fact-check verdicts to credibility scores
-            if verdict in ['true', 'correct', 'accurate', 'verified']:
-                verdict_scores.append(1.0)
-            elif verdict in ['false', 'incorrect', 'fabricated', 'fake']:
-                verdict_scores.append(0.0)
-            elif verdict in ['misleading', 'partly false', 'mixture']:
-                verdict_scores.append(0.3)
-            elif verdict in ['unproven', 'unsubstantiated', 'research in progress']:
-                verdict_scores.append(0.4)
-            else:
-                verdict_scores.append(0.5)  # Unknown verdict
+            total += _VERDICT_SCORES.get(result.get('verdict', '').lower(), 0.5)
+            count += 1
         
-        # Average the scores
-        return sum(verdict_scores) / len(verdict_scores) if verdict_scores else 0.5
+        # Average the scores; neutral when no fact-checks available
+        return total / count if count else 0.5
     
     def _calculate_source_score(self, domain: Optional[str]) -> float:
         """Calculate score from source reputation (0-1 scale)."""
         if not domain:
             return 0.5  # Neutral score for unknown domain
         
-        # Clean domain name
-        domain = domain.lower()
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
+        return self._source_score_cache(domain)
+    
+    def _lookup_source_score(self, domain: str) -> float:
+        """Look up the reputation of a raw domain name."""
         # Look up in reputation database
-        reputation = self.domain_reputation.get(domain)
+        reputation = self.domain_reputation.get(_normalize_domain(domain))
         
         if reputation is not None:
             return reputation
@@ -159,4 +188,5 @@ class CredibilityScorer:
             new_weights = {k: v/total for k, v in new_weights.items()}
         
         self.weights.update(new_weights)
+        self._weights = self._resolve_weights()
         logger.info(f"Updated weights: {self.weights}")
\ No newline at end of file
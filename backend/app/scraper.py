@@ -1,21 +1,137 @@
 """Web scraper module for extracting article content from URLs."""
 
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+from importlib.util import find_spec
 from urllib.parse import urlparse
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Prefer the C-based lxml parser, falling back to the stdlib one
+HTML_PARSER = 'lxml' if find_spec('lxml') else 'html.parser'
+
+# Only build the parts of the document we extract from
+PARSE_ONLY = SoupStrainer(['title', 'meta', 'h1', 'article', 'main', 'body', 'p'])
+
+_WS_RE = re.compile(r'\s+')
+
+
+def _compile_selectors(*selectors: str) -> Tuple[sv.SoupSieve, Tuple[sv.SoupSieve, ...]]:
+    """Compile a combined query plus one matcher per selector, in priority order."""
+    return sv.compile(', '.join(selectors)), tuple(sv.compile(s) for s in selectors)
+
+
+def _first_matches(soup: BeautifulSoup, selectors) -> Iterator:
+    """
+    Yield the first element matching each selector, in priority order.
+    
+    The tree is walked once with the combined query; the per-selector matchers
+    only run against that (small) result list, so priority stays independent
+    of document order.
+    """
+    query, patterns = selectors
+    matches = query.select(soup)
+    for pattern in patterns:
+        for element in matches:
+            if pattern.match(element):
+                yield element
+                break
+
+
+def _first_nodes(tree, selectors: Tuple[str, ...]) -> Iterator:
+    """
+    selectolax counterpart of _first_matches, taking the raw selector strings.
+    
+    Uses css_first per selector: node.css_matches() is also true when only a
+    descendant matches, so it can't filter a combined query's results.
+    """
+    for selector in selectors:
+        node = tree.css_first(selector)
+        if node is not None:
+            yield node
+
+
+TITLE_SELECTOR_LIST = (
+    'h1',
+    'title',
+    '[property="og:title"]',
+    '[name="twitter:title"]',
+    '.article-title',
+    '.post-title',
+    '.entry-title'
+)
+
+CONTENT_SELECTOR_LIST = (
+    'article',
+    '[role="main"]',
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.content',
+    '.story-body',
+    '.article-body',
+    'main'
+)
+
+TITLE_SELECTORS = _compile_selectors(*TITLE_SELECTOR_LIST)
+CONTENT_SELECTORS = _compile_selectors(*CONTENT_SELECTOR_LIST)
+
+UNWANTED_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']
+
+# Read response bodies in chunks of this many bytes
+CHUNK_SIZE = 64 * 1024
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+def _build_session() -> requests.Session:
+    """Create a session with a connection pool large enough for concurrent scrapes."""
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared by all scrapers so keep-alive connections survive across instances
+_SESSION = _build_session()
+
 
 class ArticleScraper:
     """Scraper for extracting article content from web pages."""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_bytes: int = 2_000_000):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.max_bytes = max_bytes
+        self.session = _SESSION
+        self._async_client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Async HTTP client, created on first use so connections are pooled."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={'User-Agent': USER_AGENT},
+                follow_redirects=True
+            )
+        return self._async_client
+    
+    async def aclose(self):
+        """Close the async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def extract_article(self, url: str) -> Dict[str, Optional[str]]:
         """
@@ -28,110 +144,163 @@ class ArticleScraper:
             Dict containing 'text', 'title', 'domain', and 'error' keys
         """
         try:
-            # Validate URL
-            parsed_url = urlparse(url)
-            if not parsed_url.scheme or not parsed_url.netloc:
-                return {
-                    'text': None,
-                    'title': None,
-                    'domain': None,
-                    'error': 'Invalid URL format'
-                }
+            domain, error = self._parse_domain(url)
+            if error:
+                return error
             
-            domain = parsed_url.netloc.lower()
-            if domain.startswith('www.'):
-                domain = domain[4:]
+            # Fetch the page, reading at most max_bytes of the body
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                
+                error = self._check_content_type(response.headers, domain)
+                if error:
+                    return error
+                
+                content = bytearray()
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if self._append_capped(content, chunk):
+                        break
             
-            # Fetch the page
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            return self._parse_article(bytes(content), domain)
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title = self._extract_title(soup)
-            
-            # Extract main content
-            text = self._extract_main_content(soup)
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def extract_article_async(self, url: str) -> Dict[str, Optional[str]]:
+        """
+        Extract article content from a URL without blocking the event loop.
+        
+        Same result as extract_article; only the transport differs.
+        """
+        try:
+            domain, error = self._parse_domain(url)
+            if error:
+                return error
             
-            if not text:
-                return {
-                    'text': None,
-                    'title': title,
-                    'domain': domain,
-                    'error': 'Could not extract article content'
-                }
+            # Fetch the page, reading at most max_bytes of the body
+            async with self.async_client.stream('GET', url) as response:
+                response.raise_for_status()
+                
+                error = self._check_content_type(response.headers, domain)
+                if error:
+                    return error
+                
+                content = bytearray()
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    if self._append_capped(content, chunk):
+                        break
             
-            return {
-                'text': text,
-                'title': title,
-                'domain': domain,
-                'error': None
-            }
+            # Parsing is CPU-bound, so keep it off the event loop
+            return await asyncio.to_thread(self._parse_article, bytes(content), domain)
             
-        except requests.exceptions.RequestException as e:
-            return {
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def extract_articles(self, urls: List[str]) -> List[Dict[str, Optional[str]]]:
+        """Extract several articles concurrently, returning results in input order."""
+        return list(await asyncio.gather(*(self.extract_article_async(url) for url in urls)))
+    
+    def _append_capped(self, content: bytearray, chunk: bytes) -> bool:
+        """Append chunk to content, truncating at max_bytes; return True once the cap is hit."""
+        content.extend(chunk)
+        if len(content) >= self.max_bytes:
+            del content[self.max_bytes:]
+            return True
+        return False
+    
+    def _error_result(self, error: Exception) -> Dict[str, Optional[str]]:
+        """Map an exception raised while fetching or parsing to an error result."""
+        if isinstance(error, (requests.exceptions.RequestException, httpx.HTTPError)):
+            message = f'Failed to fetch URL: {str(error)}'
+        else:
+            message = f'Scraping error: {str(error)}'
+        return {
+            'text': None,
+            'title': None,
+            'domain': None,
+            'error': message
+        }
+    
+    def _parse_domain(self, url: str) -> Tuple[Optional[str], Optional[Dict[str, Optional[str]]]]:
+        """Validate url and return (domain, None), or (None, error result)."""
+        parsed_url = urlparse(url)
+        if not parsed_url.scheme or not parsed_url.netloc:
+            return None, {
                 'text': None,
                 'title': None,
                 'domain': None,
-                'error': f'Failed to fetch URL: {str(e)}'
+                'error': 'Invalid URL format'
             }
-        except Exception as e:
+        
+        domain = parsed_url.netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain, None
+    
+    def _check_content_type(self, headers, domain: str) -> Optional[Dict[str, Optional[str]]]:
+        """Return an error result if the response is not an HTML/XML document."""
+        content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type and not content_type.endswith(('html', 'xml')):
             return {
                 'text': None,
                 'title': None,
-                'domain': None,
-                'error': f'Scraping error: {str(e)}'
+                'domain': domain,
+                'error': f'Unsupported content type: {content_type}'
             }
+        return None
+    
+    def _parse_article(self, content: bytes, domain: str) -> Dict[str, Optional[str]]:
+        """Parse downloaded HTML into the extract_article result dict."""
+        if LexborHTMLParser is not None:
+            # C DOM from selectolax: much faster than building a BeautifulSoup tree
+            tree = LexborHTMLParser(content)
+            title = self._extract_title_lexbor(tree)
+            text = self._extract_main_content_lexbor(tree)
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER, parse_only=PARSE_ONLY)
+            
+            # Extract title
+            title = self._extract_title(soup)
+            
+            # Extract main content
+            text = self._extract_main_content(soup)
+        
+        if not text:
+            return {
+                'text': None,
+                'title': title,
+                'domain': domain,
+                'error': 'Could not extract article content'
+            }
+        
+        return {
+            'text': text,
+            'title': title,
+            'domain': domain,
+            'error': None
+        }
     
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract article title from HTML."""
         # Try various title selectors
-        title_selectors = [
-            'h1',
-            'title',
-            '[property="og:title"]',
-            '[name="twitter:title"]',
-            '.article-title',
-            '.post-title',
-            '.entry-title'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text(strip=True) if hasattr(element, 'get_text') else element.get('content', '')
-                if title and len(title) > 5:  # Basic validation
-                    return title
+        for element in _first_matches(soup, TITLE_SELECTORS):
+            title = element.get_text(strip=True) if hasattr(element, 'get_text') else element.get('content', '')
+            if title and len(title) > 5:  # Basic validation
+                return title
         
         return None
     
     def _extract_main_content(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract main article content from HTML."""
         # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
+        for element in soup(UNWANTED_TAGS):
             element.decompose()
         
         # Try common article content selectors
-        content_selectors = [
-            'article',
-            '[role="main"]',
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.content',
-            '.story-body',
-            '.article-body',
-            'main'
-        ]
-        
-        for selector in content_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = self._clean_text(element.get_text())
-                if text and len(text) > 100:  # Minimum content length
-                    return text
+        for element in _first_matches(soup, CONTENT_SELECTORS):
+            text = self._clean_text(element.get_text())
+            if text and len(text) > 100:  # Minimum content length
+                return text
         
         # Fallback: extract from body and filter by paragraph length
         body = soup.find('body')
@@ -148,10 +317,40 @@ class ArticleScraper:
         
         return None
     
+    def _extract_title_lexbor(self, tree) -> Optional[str]:
+        """Extract article title from a selectolax tree."""
+        for node in _first_nodes(tree, TITLE_SELECTOR_LIST):
+            title = node.text(strip=True)
+            if title and len(title) > 5:  # Basic validation
+                return title
+        
+        return None
+    
+    def _extract_main_content_lexbor(self, tree) -> Optional[str]:
+        """Extract main article content from a selectolax tree."""
+        # Remove unwanted elements
+        tree.strip_tags(UNWANTED_TAGS)
+        
+        # Try common article content selectors
+        for node in _first_nodes(tree, CONTENT_SELECTOR_LIST):
+            text = self._clean_text(node.text())
+            if text and len(text) > 100:  # Minimum content length
+                return text
+        
+        # Fallback: extract from body and filter by paragraph length
+        if tree.body is not None:
+            article_text = []
+            for p in tree.body.css('p'):
+                text = self._clean_text(p.text())
+                if len(text) > 50:  # Filter out short paragraphs
+                    article_text.append(text)
+            
+            if article_text:
+                return '\n\n'.join(article_text)
+        
+        return None
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        return text
\ No newline at end of file
+        # Collapse runs of whitespace and trim the ends
+        return _WS_RE.sub(' ', text).strip()
\ No newline at end of file
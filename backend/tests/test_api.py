@@ -9,11 +9,65 @@ import os
 # Add the backend directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.main import app
+from app.main import app, url_cache
 
 client = TestClient(app)
 
 
+class StubScraper:
+    """Scraper double that counts fetches and returns a canned article."""
+    
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+    
+    async def extract_article_async(self, url):
+        self.calls += 1
+        return {
+            'text': None if self.error else "Article body with enough text to analyze.",
+            'title': f"Stub article {self.calls}",
+            'domain': "example.com",
+            'error': self.error
+        }
+
+
+class StubDetector:
+    model_name = "stub-model"
+    
+    def predict(self, text):
+        return {'label': 'Real', 'confidence': 0.9, 'truncated': False}
+    
+    def analyze_sentences(self, text, sentences=None):
+        return []
+
+
+class StubFactChecker:
+    async def check_claims(self, text, sentences=None):
+        return []
+
+
+class StubScorer:
+    def calculate_credibility_score(self, model_prediction, fact_check_results, domain=None):
+        return {
+            'credibility_score': 80.0,
+            'source_reputation': 0.8,
+            'breakdown': {'model_score': 90.0, 'factcheck_score': 50.0, 'source_score': 80.0}
+        }
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch):
+    """Replace the URL prediction pipeline with stubs and start from an empty URL cache."""
+    scraper = StubScraper()
+    monkeypatch.setattr("app.main.scraper", scraper)
+    monkeypatch.setattr("app.main.nlp_detector", StubDetector())
+    monkeypatch.setattr("app.main.fact_checker", StubFactChecker())
+    monkeypatch.setattr("app.main.scorer", StubScorer())
+    url_cache.clear()
+    yield scraper
+    url_cache.clear()
+
+
 class TestAPI:
     """Test cases for the API endpoints."""
     
@@ -90,6 +144,44 @@ class TestAPI:
         assert response.status_code in [200, 400]
 
 
+
+class TestPredictURLCache:
+    """Test cases for the /predict-url response cache."""
+    
+    payload = {"url": "https://example.com/article"}
+    
+    def test_repeat_request_served_from_cache(self, stub_pipeline):
+        """A second request for the same URL does not scrape again."""
+        first = client.post("/predict-url", json=self.payload)
+        second = client.post("/predict-url", json=self.payload)
+        
+        assert first.status_code == second.status_code == 200
+        assert stub_pipeline.calls == 1
+        assert second.json() == first.json()
+        assert len(url_cache) == 1
+    
+    def test_nocache_rescrapes_and_replaces_entry(self, stub_pipeline):
+        """nocache=1 bypasses the cache and stores the fresh result."""
+        client.post("/predict-url", json=self.payload)
+        
+        response = client.post("/predict-url?nocache=1", json=self.payload)
+        assert response.status_code == 200
+        assert stub_pipeline.calls == 2
+        assert response.json()["metadata"]["title"] == "Stub article 2"
+        assert json.loads(url_cache[self.payload["url"]]) == response.json()
+    
+    def test_errors_are_not_cached(self, stub_pipeline):
+        """A failed scrape raises a 400 and leaves the cache empty."""
+        stub_pipeline.error = "Connection refused"
+        
+        response = client.post("/predict-url", json=self.payload)
+        assert response.status_code == 400
+        assert len(url_cache) == 0
+        
+        client.post("/predict-url", json=self.payload)
+        assert stub_pipeline.calls == 2
+
+
 def test_sample_fake_news():
     """Test with a sample fake news text."""
     fake_text = """
@@ -0,0 +1,235 @@
+"""Unit tests for the article scraper."""
+
+import pytest
+import asyncio
+import httpx
+import requests
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import scraper as scraper_module
+from app.scraper import ArticleScraper
+
+ARTICLE_TEXT = "The council approved the new budget after a long debate on Tuesday evening. " * 3
+JUNK_TEXT = "Sponsored links and other unrelated promotional junk text for readers. " * 3
+
+PAGES = {
+    "main_wraps_article": (
+        f"<html><head><title>Page title here</title></head><body>"
+        f"<main><div>{JUNK_TEXT}</div><article><p>{ARTICLE_TEXT}</p></article></main>"
+        f"</body></html>"
+    ),
+    "role_main_wraps_article": (
+        f"<html><body><div role=\"main\"><div>{JUNK_TEXT}</div>"
+        f"<article><h1>Budget approved</h1><p>{ARTICLE_TEXT}</p></article></div></body></html>"
+    ),
+    "title_container_wraps_h1": (
+        f"<html><body><header class=\"entry-title\"><h1>Budget approved</h1><span>By X</span></header>"
+        f"<article><p>{ARTICLE_TEXT}</p></article></body></html>"
+    ),
+    "body_paragraph_fallback": (
+        f"<html><body><nav><p>{JUNK_TEXT}</p></nav><p>{ARTICLE_TEXT}</p><p>short</p>"
+        f"<p>{ARTICLE_TEXT}</p></body></html>"
+    ),
+}
+
+
+def parse(html):
+    return ArticleScraper()._parse_article(html.encode(), "example.com")
+
+
+@pytest.fixture
+def no_selectolax(monkeypatch):
+    """Force the BeautifulSoup parsing path."""
+    monkeypatch.setattr(scraper_module, "LexborHTMLParser", None)
+
+
+class TestParseArticle:
+    """Test cases for HTML parsing with the BeautifulSoup and selectolax backends."""
+
+    @pytest.mark.parametrize("name", PAGES)
+    def test_backends_agree(self, name, monkeypatch):
+        """Both parsing backends return the same result."""
+        if scraper_module.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+        lexbor_result = parse(PAGES[name])
+        monkeypatch.setattr(scraper_module, "LexborHTMLParser", None)
+        assert parse(PAGES[name]) == lexbor_result
+
+    @pytest.mark.parametrize("backend", ["selectolax", "bs4"])
+    def test_article_inside_main_container(self, backend, monkeypatch):
+        """An <article> wins over a wrapping <main>, so wrapper junk is excluded."""
+        if backend == "bs4":
+            monkeypatch.setattr(scraper_module, "LexborHTMLParser", None)
+        elif scraper_module.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+
+        result = parse(PAGES["main_wraps_article"])
+        assert result["error"] is None
+        assert result["text"] == ARTICLE_TEXT.strip()
+        assert result["title"] == "Page title here"
+
+    @pytest.mark.parametrize("backend", ["selectolax", "bs4"])
+    def test_h1_inside_title_container(self, backend, monkeypatch):
+        """The <h1> is the title, not the whole container holding it."""
+        if backend == "bs4":
+            monkeypatch.setattr(scraper_module, "LexborHTMLParser", None)
+        elif scraper_module.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+
+        assert parse(PAGES["title_container_wraps_h1"])["title"] == "Budget approved"
+
+    def test_body_paragraph_fallback(self, no_selectolax):
+        """Without a content container, long body paragraphs are joined."""
+        result = parse(PAGES["body_paragraph_fallback"])
+        assert result["text"] == f"{ARTICLE_TEXT.strip()}\n\n{ARTICLE_TEXT.strip()}"
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response."""
+
+    def __init__(self, body=b"", content_type="text/html", status_code=200):
+        self.body = body
+        self.headers = {"Content-Type": content_type}
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Client Error")
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+class FakeSession:
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+
+    def get(self, url, **kwargs):
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def sync_scraper(max_bytes=2_000_000, **session_kwargs):
+    scraper = ArticleScraper(max_bytes=max_bytes)
+    scraper.session = FakeSession(**session_kwargs)
+    return scraper
+
+
+def async_scraper(handler, max_bytes=2_000_000):
+    scraper = ArticleScraper(max_bytes=max_bytes)
+    scraper._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return scraper
+
+
+def run_async(scraper, url="https://example.com/article"):
+    async def fetch():
+        try:
+            return await scraper.extract_article_async(url)
+        finally:
+            await scraper.aclose()
+    return asyncio.run(fetch())
+
+
+def capture_content(scraper):
+    """Make _parse_article return the raw bytes it was given."""
+    scraper._parse_article = lambda content, domain: {"content": content, "domain": domain}
+    return scraper
+
+
+class TestExtractArticle:
+    """Test cases for the requests-based fetch path."""
+
+    def test_unsupported_content_type(self):
+        scraper = sync_scraper(response=FakeResponse(b"%PDF-1.4", content_type="application/pdf"))
+        result = scraper.extract_article("https://www.example.com/report.pdf")
+        assert result["error"] == "Unsupported content type: application/pdf"
+        assert result["domain"] == "example.com"
+
+    def test_body_truncated_at_max_bytes(self):
+        scraper = capture_content(sync_scraper(max_bytes=100_000, response=FakeResponse(b"x" * 300_000)))
+        result = scraper.extract_article("https://example.com/article")
+        assert result["content"] == b"x" * 100_000
+
+    def test_http_error(self):
+        scraper = sync_scraper(response=FakeResponse(status_code=404))
+        result = scraper.extract_article("https://example.com/missing")
+        assert result["error"].startswith("Failed to fetch URL:")
+        assert result["text"] is None
+
+    def test_connection_error(self):
+        scraper = sync_scraper(error=requests.exceptions.ConnectionError("refused"))
+        result = scraper.extract_article("https://example.com/article")
+        assert result["error"] == "Failed to fetch URL: refused"
+
+    def test_invalid_url(self):
+        assert sync_scraper().extract_article("not-a-url")["error"] == "Invalid URL format"
+
+
+class TestExtractArticleAsync:
+    """Test cases for the httpx-based fetch path."""
+
+    def test_parses_article(self):
+        scraper = async_scraper(
+            lambda request: httpx.Response(200, headers={"Content-Type": "text/html"}, content=PAGES["main_wraps_article"].encode())
+        )
+        result = run_async(scraper, "https://www.example.com/article")
+        assert result["error"] is None
+        assert result["domain"] == "example.com"
+        assert result["text"] == ARTICLE_TEXT.strip()
+
+    def test_unsupported_content_type(self):
+        scraper = async_scraper(
+            lambda request: httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=b"%PDF-1.4")
+        )
+        assert run_async(scraper)["error"] == "Unsupported content type: application/pdf"
+
+    def test_body_truncated_at_max_bytes(self):
+        scraper = capture_content(async_scraper(
+            lambda request: httpx.Response(200, headers={"Content-Type": "text/html"}, content=b"x" * 300_000),
+            max_bytes=100_000
+        ))
+        assert run_async(scraper)["content"] == b"x" * 100_000
+
+    def test_http_error(self):
+        scraper = async_scraper(lambda request: httpx.Response(404))
+        result = run_async(scraper)
+        assert result["error"].startswith("Failed to fetch URL:")
+        assert result["text"] is None
+
+    def test_connection_error(self):
+        def refuse(request):
+            raise httpx.ConnectError("refused")
+        assert run_async(async_scraper(refuse))["error"] == "Failed to fetch URL: refused"
+
+    def test_extract_articles_keeps_input_order(self):
+        def handler(request):
+            if request.url.path.endswith(".pdf"):
+                return httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=b"%PDF")
+            return httpx.Response(200, headers={"Content-Type": "text/html"}, content=PAGES["main_wraps_article"].encode())
+        scraper = async_scraper(handler)
+
+        async def fetch():
+            try:
+                return await scraper.extract_articles(
+                    ["https://example.com/a", "https://example.com/b.pdf", "bad"]
+                )
+            finally:
+                await scraper.aclose()
+
+        results = asyncio.run(fetch())
+        assert [r["error"] for r in results] == [
+            None, "Unsupported content type: application/pdf", "Invalid URL format"
+        ]
@@ -0,0 +1,83 @@
+"""Unit tests for the project structure validation script."""
+
+import pytest
+import json
+import runpy
+import shutil
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import validate_structure
+
+ALL_FILES = [filepath for _, _, files in validate_structure.SECTIONS for filepath, _ in files]
+FRONTEND_FILES = [filepath for filepath, _ in validate_structure.FRONTEND_FILES]
+
+
+@pytest.fixture
+def project_tree(tmp_path, monkeypatch):
+    """Create every expected file under tmp_path and run from there."""
+    for filepath in ALL_FILES:
+        path = tmp_path / filepath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def run_json(capsys, fail_fast=False):
+    """Run the validator in JSON mode, returning (return value, parsed output)."""
+    success = validate_structure.validate_project_structure(fail_fast=fail_fast, as_json=True)
+    return success, json.loads(capsys.readouterr().out)
+
+
+class TestValidateStructureJSON:
+    """Test cases for the --json output and --fail-fast behavior."""
+
+    @pytest.mark.parametrize("fail_fast", [False, True])
+    def test_all_present(self, project_tree, capsys, fail_fast):
+        """A complete tree passes with nothing missing."""
+        success, result = run_json(capsys, fail_fast)
+        assert success is True
+        assert result == {"ok": True, "missing": []}
+
+    @pytest.mark.parametrize("fail_fast", [False, True])
+    def test_one_file_missing(self, project_tree, capsys, fail_fast):
+        """A single missing file is reported by path."""
+        (project_tree / "backend/app/scoring.py").unlink()
+
+        success, result = run_json(capsys, fail_fast)
+        assert success is False
+        assert result == {"ok": False, "missing": ["backend/app/scoring.py"]}
+
+    def test_missing_root_lists_all_section_files(self, project_tree, capsys):
+        """A missing frontend/ root reports every frontend file as missing."""
+        shutil.rmtree(project_tree / "frontend")
+
+        success, result = run_json(capsys)
+        assert success is False
+        assert result == {"ok": False, "missing": FRONTEND_FILES}
+
+    def test_missing_root_fail_fast(self, project_tree, capsys):
+        """With fail_fast, checking stops at the missing frontend/ root."""
+        shutil.rmtree(project_tree / "frontend")
+        (project_tree / "demo.py").unlink()
+
+        success, result = run_json(capsys, fail_fast=True)
+        assert success is False
+        assert result == {"ok": False, "missing": FRONTEND_FILES}
+
+
+@pytest.mark.parametrize("args, code", [([], 0), (["--fail-fast"], 0), (["--json", "--fail-fast"], 1)])
+def test_cli_exit_codes(project_tree, monkeypatch, args, code):
+    """The CLI exits 0 on a complete tree and 1 when files are missing."""
+    if code:
+        (project_tree / "README.md").unlink()
+    monkeypatch.setattr(sys, "argv", ["validate_structure.py", *args])
+
+    script = os.path.join(os.path.dirname(__file__), '..', '..', 'validate_structure.py')
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_path(script, run_name="__main__")
+    assert exc_info.value.code == code
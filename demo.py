@@ -4,6 +4,7 @@ Demo script for testing the Fake News Detector components.
 Run this to verify the backend modules work correctly.
 """
 
+import asyncio
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
@@ -14,6 +15,13 @@ from backend.app.factcheck_adapter import FactCheckAdapter
 from backend.app.scoring import CredibilityScorer
 from backend.app.scraper import ArticleScraper
 
+async def check_claims(fact_checker, text):
+    """Check claims and close the adapter's HTTP client before the event loop ends."""
+    try:
+        return await fact_checker.check_claims(text)
+    finally:
+        await fact_checker.aclose()
+
 def test_components():
     """Test all components individually."""
     print("🔍 Testing Fake News Detector Components")
@@ -47,7 +55,7 @@ def test_components():
     # Test 3: Fact Checker
     print("\n3. Testing Fact Checker...")
     fact_checker = FactCheckAdapter(config.factcheck_api_key)
-    fact_results = fact_checker.check_claims("Test claim for fact checking")
+    fact_results = asyncio.run(check_claims(fact_checker, "Test claim for fact checking"))
     print(f"   Fact-check results: {len(fact_results)} claims")
     if fact_results:
         print(f"   First result: {fact_results[0]['verdict']}")
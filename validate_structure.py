@@ -4,96 +4,235 @@ Lightweight validation script to check project structure.
 This doesn't require ML dependencies to be installed.
 """
 
+import argparse
+import json
 import os
-from pathlib import Path
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-def check_file_exists(filepath, description):
-    """Check if a file exists and print status."""
-    if Path(filepath).exists():
-        print(f"✅ {description}: {filepath}")
-        return True
-    else:
-        print(f"❌ {description}: {filepath} (missing)")
-        return False
+# Below this many directories, thread startup costs more than it saves
+PARALLEL_THRESHOLD = 4
+
+_SEP = "=" * 55
+_FAIL_TMPL = "❌ {0}: {1} (missing)".format
+_COUNT_TMPL = "✅ {0}/{1} files present".format
+_PARTIAL_TMPL = "❌ {0}/{1} files present".format
+_SKIP_TMPL = "❌ {0}/ directory missing — skipping {1} file checks".format
+
+# Expected files as (path, description), grouped by report section
+Manifest = Tuple[Tuple[str, str], ...]
+
+BACKEND_FILES: Manifest = (
+    ("backend/requirements.txt", "Backend dependencies"),
+    ("backend/config.yaml", "Configuration file"),
+    ("backend/domain_reputation.json", "Domain reputation database"),
+    ("backend/app/__init__.py", "App package init"),
+    ("backend/app/main.py", "FastAPI main application"),
+    ("backend/app/models.py", "Pydantic models"),
+    ("backend/app/config.py", "Configuration module"),
+    ("backend/app/nlp_engine.py", "NLP engine"),
+    ("backend/app/factcheck_adapter.py", "Fact-check adapter"),
+    ("backend/app/scoring.py", "Scoring module"),
+    ("backend/app/scraper.py", "Web scraper"),
+    ("backend/tests/__init__.py", "Tests package init"),
+    ("backend/tests/test_api.py", "API unit tests"),
+    ("backend/app.py", "Alternative entry point"),
+)
+
+FRONTEND_FILES: Manifest = (
+    ("frontend/package.json", "Frontend dependencies"),
+    ("frontend/public/index.html", "HTML template"),
+    ("frontend/public/manifest.json", "PWA manifest"),
+    ("frontend/src/index.js", "React entry point"),
+    ("frontend/src/index.css", "Global styles"),
+    ("frontend/src/App.js", "Main React component"),
+    ("frontend/src/components/InputForm.js", "Input form component"),
+    ("frontend/src/components/ResultCard.js", "Result display component"),
+    ("frontend/src/components/HistorySection.js", "History component"),
+)
+
+OTHER_FILES: Manifest = (
+    ("README.md", "Project documentation"),
+    ("scripts/test_requests.sh", "API test script"),
+    (".env.example", "Environment variables example"),
+    ("start_demo.sh", "Demo startup script"),
+    ("demo.py", "Component demo script"),
+)
+
+# Report sections in print order: (header, root directory or None, files)
+Section = Tuple[str, Optional[str], Manifest]
+SectionResult = Tuple[str, Optional[str], Manifest, Optional[List[Tuple[str, str]]]]
+
+SECTIONS: Tuple[Section, ...] = (
+    ("\n📁 Backend Files:", "backend", BACKEND_FILES),
+    ("\n🎨 Frontend Files:", "frontend", FRONTEND_FILES),
+    ("\n📜 Scripts and Documentation:", None, OTHER_FILES),
+)
+
+# Distinct parent directories of each section's files, in first-seen order
+SECTION_DIRS: Dict[Optional[str], Tuple[str, ...]] = {
+    root: tuple(dict.fromkeys(os.path.dirname(filepath) for filepath, _ in files))
+    for _, root, files in SECTIONS
+}
+
+PASSED_FOOTER: Tuple[str, ...] = (
+    "🎉 Project structure validation PASSED!",
+    "\nNext steps to run the demo:",
+    "1. cd backend && python -m venv venv && source venv/bin/activate",
+    "2. pip install -r requirements.txt",
+    "3. uvicorn app.main:app --reload --host 0.0.0.0 --port 8000",
+    "4. In another terminal: cd frontend && npm install && npm start",
+    "5. Open http://localhost:3000 in your browser",
+    "\nOr simply run: ./start_demo.sh",
+)
 
-def validate_project_structure():
-    """Validate the complete project structure."""
-    print("🔍 Validating Fake News Detector Project Structure")
-    print("=" * 55)
+FAILED_FOOTER: Tuple[str, ...] = (
+    "❌ Project structure validation FAILED!",
+    "Some files are missing. Please check the errors above.",
+)
+
+@lru_cache(maxsize=None)
+def list_dir(dirpath: str) -> Optional[Mapping[str, os.DirEntry]]:
+    """Return a directory's entries by name (empty if it doesn't exist).
     
-    all_good = True
+    Returns None if the directory exists but can't be listed. Memoized, so
+    files sharing a directory cost one directory read instead of one stat each.
+    The DirEntry objects carry the file type from readdir, so kind checks
+    usually need no further syscall.
+    """
+    try:
+        with os.scandir(dirpath or ".") as entries:
+            return MappingProxyType({entry.name: entry for entry in entries})
+    except (FileNotFoundError, NotADirectoryError):
+        return MappingProxyType({})
+    except OSError:
+        return None
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Return the stat result for path, or None if it can't be stat'ed.
     
-    # Backend files
-    print("\n📁 Backend Files:")
-    backend_files = [
-        ("backend/requirements.txt", "Backend dependencies"),
-        ("backend/config.yaml", "Configuration file"),
-        ("backend/domain_reputation.json", "Domain reputation database"),
-        ("backend/app/__init__.py", "App package init"),
-        ("backend/app/main.py", "FastAPI main application"),
-        ("backend/app/models.py", "Pydantic models"),
-        ("backend/app/config.py", "Configuration module"),
-        ("backend/app/nlp_engine.py", "NLP engine"),
-        ("backend/app/factcheck_adapter.py", "Fact-check adapter"),
-        ("backend/app/scoring.py", "Scoring module"),
-        ("backend/app/scraper.py", "Web scraper"),
-        ("backend/tests/__init__.py", "Tests package init"),
-        ("backend/tests/test_api.py", "API unit tests"),
-        ("backend/app.py", "Alternative entry point"),
-    ]
+    Kind checks can use stat.S_ISREG(st.st_mode) on the result without a
+    second syscall.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def prefetch_listings(dirpaths: Iterable[str], max_workers: int = 8) -> None:
+    """Warm the list_dir cache for dirpaths, in parallel if worthwhile."""
+    dirpaths = list(dict.fromkeys(dirpaths))
+    if len(dirpaths) < PARALLEL_THRESHOLD:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(dirpaths))) as executor:
+        list(executor.map(list_dir, dirpaths))
+
+def file_exists(filepath: str) -> bool:
+    """Check if a regular file (or a symlink to one) exists at filepath."""
+    dirpath, name = os.path.split(filepath)
+    entries = list_dir(dirpath)
+    # Unlistable directory: fall back to a single stat of the file itself
+    if entries is None:
+        st = _stat_or_none(filepath)
+        return st is not None and stat.S_ISREG(st.st_mode)
+    entry = entries.get(name)
+    # is_file() uses the cached d_type; only symlinks cost an extra stat
+    return entry is not None and entry.is_file()
+
+def find_missing(fail_fast: bool = False) -> List[SectionResult]:
+    """Check each section, returning (header, root, files, missing) per section checked.
     
-    for filepath, description in backend_files:
-        if not check_file_exists(filepath, description):
-            all_good = False
+    missing is None when the section's root directory doesn't exist. With
+    fail_fast, stop at the first missing file or root.
+    """
+    # Start from an empty cache so repeated runs see the current tree
+    list_dir.cache_clear()
+    
+    # A missing section root fails the whole section with one probe
+    present = {root: root is None or os.path.isdir(root) for _, root, _ in SECTIONS}
+    if not fail_fast:
+        # Read every directory we need up front; the checks below are then set lookups
+        prefetch_listings(
+            dirpath for root, dirpaths in SECTION_DIRS.items() if present[root] for dirpath in dirpaths
+        )
+    
+    results: List[SectionResult] = []
+    for header, root, files in SECTIONS:
+        if not present[root]:
+            results.append((header, root, files, None))
+            if fail_fast:
+                break
+            continue
+        
+        misses = ((filepath, description) for filepath, description in files if not file_exists(filepath))
+        missing = list(islice(misses, 1)) if fail_fast else list(misses)
+        results.append((header, root, files, missing))
+        if fail_fast and missing:
+            break
+    
+    return results
+
+def validate_project_structure(fail_fast: bool = False, as_json: bool = False) -> bool:
+    """Validate the complete project structure.
     
-    # Frontend files
-    print("\n🎨 Frontend Files:")
-    frontend_files = [
-        ("frontend/package.json", "Frontend dependencies"),
-        ("frontend/public/index.html", "HTML template"),
-        ("frontend/public/manifest.json", "PWA manifest"),
-        ("frontend/src/index.js", "React entry point"),
-        ("frontend/src/index.css", "Global styles"),
-        ("frontend/src/App.js", "Main React component"),
-        ("frontend/src/components/InputForm.js", "Input form component"),
-        ("frontend/src/components/ResultCard.js", "Result display component"),
-        ("frontend/src/components/HistorySection.js", "History component"),
-    ]
+    With fail_fast, stop checking at the first missing file. With as_json,
+    write a single JSON object instead of the human-readable report.
+    """
+    results = find_missing(fail_fast)
+    all_good = all(missing == [] for *_, missing in results)
     
-    for filepath, description in frontend_files:
-        if not check_file_exists(filepath, description):
-            all_good = False
+    if as_json:
+        missing_paths = [
+            filepath
+            for _, _, files, missing in results
+            for filepath, _ in (files if missing is None else missing)
+        ]
+        sys.stdout.write(json.dumps({"ok": all_good, "missing": missing_paths}) + "\n")
+        sys.stdout.flush()
+        return all_good
     
-    # Scripts and documentation
-    print("\n📜 Scripts and Documentation:")
-    other_files = [
-        ("README.md", "Project documentation"),
-        ("scripts/test_requests.sh", "API test script"),
-        (".env.example", "Environment variables example"),
-        ("start_demo.sh", "Demo startup script"),
-        ("demo.py", "Component demo script"),
-    ]
+    # Collect the report and write it in one go rather than a print per line
+    lines: List[str] = ["🔍 Validating Fake News Detector Project Structure", _SEP]
     
-    for filepath, description in other_files:
-        if not check_file_exists(filepath, description):
-            all_good = False
+    for header, root, files, missing in results:
+        lines.append(header)
+        if missing is None:
+            lines.append(_SKIP_TMPL(root, len(files)))
+            continue
+        
+        # Only misses are listed individually; present files are summarized in one line
+        if not (fail_fast and missing):
+            count_tmpl = _PARTIAL_TMPL if missing else _COUNT_TMPL
+            lines.append(count_tmpl(len(files) - len(missing), len(files)))
+        lines.extend(_FAIL_TMPL(description, filepath) for filepath, description in missing)
     
-    print("\n" + "=" * 55)
+    lines.append("\n" + _SEP)
     if all_good:
-        print("🎉 Project structure validation PASSED!")
-        print("\nNext steps to run the demo:")
-        print("1. cd backend && python -m venv venv && source venv/bin/activate")
-        print("2. pip install -r requirements.txt")
-        print("3. uvicorn app.main:app --reload --host 0.0.0.0 --port 8000")
-        print("4. In another terminal: cd frontend && npm install && npm start")
-        print("5. Open http://localhost:3000 in your browser")
-        print("\nOr simply run: ./start_demo.sh")
+        lines.extend(PASSED_FOOTER)
     else:
-        print("❌ Project structure validation FAILED!")
-        print("Some files are missing. Please check the errors above.")
+        lines.extend(FAILED_FOOTER)
     
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     return all_good
 
 if __name__ == "__main__":
-    success = validate_project_structure()
-    exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Check that the expected project files exist.")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first missing file"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print a JSON object with the result and missing paths instead of the report"
+    )
+    args = parser.parse_args()
+    success = validate_project_structure(fail_fast=args.fail_fast, as_json=args.json)
+    sys.exit(0 if success else 1)